@@ -7,25 +7,162 @@ Converte dados JSONL para CSVs limpos e organizados
 import json
 import os
 import re
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+import time
+from typing import Dict, Any, List, Optional, Tuple
+from collections import deque
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 import argparse
 import pandas as pd
 from tqdm import tqdm
 import logging
 
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:  # Fallback para a stdlib se o orjson não estiver instalado
+    json_loads = json.loads
+
+    def json_dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+try:
+    # pysimdjson: parsing sob demanda, só materializa os campos acessados
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# Tipos aceitos como objeto JSON (dict comum ou proxy lazy do simdjson)
+JSON_OBJECT_TYPES = (dict, simdjson.Object) if simdjson else (dict,)
+
+# Padrões compilados uma única vez (usados em todas as linhas processadas)
+_HTML_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+_NONALNUM_RE = re.compile(r'[^a-zA-Z0-9\s]')
+
+# Tamanho (em bytes) de cada faixa do arquivo JSONL processada por vez
+RANGE_SIZE = 32 * 1024 * 1024
+
+# Buffer das leituras linha a linha em modo binário (menos syscalls, sem decodificar texto)
+READ_BUFFER_SIZE = 1024 * 1024
+
+# Ordem das colunas das linhas montadas como tuplas pelos limpadores
+GAME_COLUMNS = (
+    'appid',
+    'name',
+    'type',
+    'short_description',
+    'currency',
+    'original_price',
+    'final_price',
+    'discount_percent',
+    'is_free',
+    'required_age',
+    'genres',
+    'genre_count',
+    'windows',
+    'mac',
+    'linux',
+    'platform_count',
+    'release_date',
+    'coming_soon',
+    'developers',
+    'publishers',
+    'screenshot_count',
+    'movie_count',
+    'has_website',
+    'supported_languages_count',
+    '_category_ids',
+    '_genre_ids',
+)
+
+REVIEW_COLUMNS = (
+    'recommendationid',
+    'appid',
+    'voted_up',
+    'recommendation',
+    'author_steamid',
+    'author_num_games_owned',
+    'author_num_reviews',
+    'playtime_forever_hours',
+    'playtime_at_review_hours',
+    'review_text',
+    'review_word_count',
+    'review_char_count',
+    'language',
+    'created_date',
+    'updated_date',
+    'was_updated',
+    'votes_up',
+    'votes_funny',
+    'comment_count',
+    'weighted_vote_score',
+    'steam_purchase',
+    'received_for_free',
+    'written_during_early_access',
+    'primarily_steam_deck',
+    'is_short_review',
+    'is_long_review',
+    'has_engagement',
+    'is_experienced_reviewer',
+    'is_experienced_gamer',
+)
+
+# Dtypes compactos aplicados depois de montar os DataFrames (o resto é inferido)
+GAME_DTYPES = {
+    'appid': 'int32',
+    'type': 'category',
+    'currency': 'category',
+    'discount_percent': 'int32',
+    'required_age': 'int32',
+    'genre_count': 'int32',
+    'platform_count': 'int32',
+    'screenshot_count': 'int32',
+    'movie_count': 'int32',
+    'supported_languages_count': 'int32',
+}
+
+REVIEW_DTYPES = {
+    'appid': 'int32',
+    'recommendation': 'category',
+    'author_num_games_owned': 'int32',
+    'author_num_reviews': 'int32',
+    'review_word_count': 'int32',
+    'review_char_count': 'int32',
+    'language': 'category',
+    'votes_up': 'int32',
+    'comment_count': 'int32',
+}
+
+INT32_MIN, INT32_MAX = -2**31, 2**31 - 1
+
+# Flags derivadas, calculadas por coluna depois de montar o DataFrame
+REVIEW_FLAG_COLUMNS = (
+    'was_updated',
+    'is_short_review',
+    'is_long_review',
+    'has_engagement',
+    'is_experienced_reviewer',
+    'is_experienced_gamer',
+)
+
+# Colunas montadas linha a linha no worker (REVIEW_COLUMNS sem as flags)
+REVIEW_ROW_COLUMNS = tuple(col for col in REVIEW_COLUMNS if col not in REVIEW_FLAG_COLUMNS)
+
 def clean_text(text: str) -> str:
     """Remove HTML tags e limpa texto"""
     if not text or not isinstance(text, str):
         return ""
     
-    # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
-    # Remove múltiplos espaços
-    text = re.sub(r'\s+', ' ', text)
-    # Remove quebras de linha
-    text = text.replace('\n', ' ').replace('\r', ' ')
-    return text.strip()
+    # Remove HTML tags (só roda o regex se houver alguma tag possível)
+    if '<' in text:
+        text = _HTML_RE.sub('', text)
+    # Colapsa espaços e quebras de linha e faz o strip numa única passada em C
+    return ' '.join(text.split())
 
 def extract_price_info(price_overview: Dict) -> Dict[str, Any]:
     """Extrai informações de preço de forma limpa"""
@@ -46,110 +183,166 @@ def extract_price_info(price_overview: Dict) -> Dict[str, Any]:
         'is_free': price_overview.get('final', 0) == 0
     }
 
+def collect_descriptions(items: List[Dict], descriptions_map: Dict[int, str]) -> None:
+    """Acumula os pares id -> descrição de categorias/gêneros no mapa informado"""
+    if not items:
+        return
+    
+    for item in items:
+        if isinstance(item, JSON_OBJECT_TYPES):
+            item_id = item.get('id')
+            item_desc = item.get('description', '')
+            if item_id and item_desc:
+                descriptions_map[item_id] = item_desc
+
 def discover_all_categories(input_file: str) -> Dict[int, str]:
     """Descobre todas as categorias presentes nos dados"""
     print("🔍 Descobrindo todas as categorias nos dados...")
     categories_map = {}
     
-    with open(input_file, 'r', encoding='utf-8') as f:
+    with open(input_file, 'rb', buffering=READ_BUFFER_SIZE) as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
                 
             try:
-                game = json.loads(line)
-                categories = game.get('categories', [])
+                game = json_loads(line)
+                collect_descriptions(game.get('categories', []), categories_map)
                 
-                if categories:
-                    for cat in categories:
-                        if isinstance(cat, dict):
-                            cat_id = cat.get('id')
-                            cat_desc = cat.get('description', '')
-                            if cat_id and cat_desc:
-                                categories_map[cat_id] = cat_desc
-                                
             except (json.JSONDecodeError, Exception):
                 continue
     
     print(f"✅ Encontradas {len(categories_map)} categorias únicas")
     return categories_map
 
-def extract_categories_dynamic(categories: List[Dict], all_categories: Dict[int, str]) -> Dict[str, bool]:
-    """Extrai todas as categorias de forma dinâmica"""
-    if not categories:
-        return {f"category_{cat_id}_{clean_category_name(desc)}": False 
-                for cat_id, desc in all_categories.items()}
-    
-    category_ids = [cat.get('id') for cat in categories if isinstance(cat, dict) and cat.get('id')]
-    
-    result = {}
-    for cat_id, desc in all_categories.items():
-        column_name = f"category_{cat_id}_{clean_category_name(desc)}"
-        result[column_name] = cat_id in category_ids
-    
-    return result
-
+@lru_cache(maxsize=None)
 def clean_category_name(category_desc: str) -> str:
     """Limpa nome da categoria para usar como nome de coluna"""
     if not category_desc:
         return "unknown"
     
     # Remove caracteres especiais e espaços
-    clean_name = re.sub(r'[^a-zA-Z0-9\s]', '', category_desc)
+    clean_name = _NONALNUM_RE.sub('', category_desc)
     # Substitui espaços por underscores e converte para minúsculas
-    clean_name = re.sub(r'\s+', '_', clean_name.strip().lower())
+    clean_name = _WS_RE.sub('_', clean_name.strip().lower())
     return clean_name
 
+def dummy_column_names(descriptions_map: Dict[int, str], prefix: str) -> Dict[int, str]:
+    """Pré-calcula o nome da coluna (prefix_id_nome) de cada categoria/gênero"""
+    return {item_id: f"{prefix}_{item_id}_{clean_category_name(desc)}"
+            for item_id, desc in descriptions_map.items()}
+
 def discover_all_genres(input_file: str) -> Dict[int, str]:
     """Descobre todos os gêneros presentes nos dados"""
     print("🔍 Descobrindo todos os gêneros nos dados...")
     genres_map = {}
     
-    with open(input_file, 'r', encoding='utf-8') as f:
+    with open(input_file, 'rb', buffering=READ_BUFFER_SIZE) as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
                 
             try:
-                game = json.loads(line)
-                genres = game.get('genres', [])
+                game = json_loads(line)
+                collect_descriptions(game.get('genres', []), genres_map)
                 
-                if genres:
-                    for genre in genres:
-                        if isinstance(genre, dict):
-                            genre_id = genre.get('id')
-                            genre_desc = genre.get('description', '')
-                            if genre_id and genre_desc:
-                                genres_map[genre_id] = genre_desc
-                                
             except (json.JSONDecodeError, Exception):
                 continue
     
     print(f"✅ Encontrados {len(genres_map)} gêneros únicos")
     return genres_map
 
-def extract_genres_dynamic(genres: List[Dict], all_genres: Dict[int, str]) -> Dict[str, bool]:
-    """Extrai todos os gêneros de forma dinâmica"""
-    if not genres:
-        return {f"genre_{genre_id}_{clean_category_name(desc)}": False 
-                for genre_id, desc in all_genres.items()}
-    
-    genre_ids = [genre.get('id') for genre in genres if isinstance(genre, dict) and genre.get('id')]
-    
-    result = {}
-    for genre_id, desc in all_genres.items():
-        column_name = f"genre_{genre_id}_{clean_category_name(desc)}"
-        result[column_name] = genre_id in genre_ids
-    
-    return result
+def extract_ids(items: List[Dict]) -> List[Any]:
+    """Extrai a lista de ids de categorias/gêneros de um jogo"""
+    if not items:
+        return []
+    return [item.get('id') for item in items if isinstance(item, JSON_OBJECT_TYPES) and item.get('id')]
+
+def build_dummy_columns(ids: pd.Series, descriptions_map: Dict[int, str], prefix: str) -> pd.DataFrame:
+    """Gera as colunas booleanas (one-hot) de categorias/gêneros de forma vetorizada"""
+    exploded = ids.explode().dropna()
+    dummies = pd.get_dummies(exploded).groupby(level=0).max()
+    dummies = dummies.reindex(index=ids.index, columns=list(descriptions_map), fill_value=False).astype(bool)
+    dummies.columns = list(dummy_column_names(descriptions_map, prefix).values())
+    return dummies
+
+class ErrorWriter:
+    """Grava as linhas problemáticas em JSONL à medida que aparecem, sem acumular na memória"""
+
+    def __init__(self, output_file: str):
+        self.error_file = output_file.replace('.csv', '_errors.jsonl').replace('.parquet', '_errors.jsonl').replace('.feather', '_errors.jsonl')
+        self.errors_written = 0
+        self._handle = None
+
+    def write(self, errors: List[Dict[str, Any]]):
+        """Grava os erros de uma faixa (o arquivo só é criado no primeiro erro)"""
+        for err in errors:
+            if self._handle is None:
+                self._handle = open(self.error_file, 'w', encoding='utf-8')
+            self._handle.write(json_dumps(err) + '\n')
+            self.errors_written += 1
+
+    def close(self):
+        """Fecha o arquivo de erros, se algum erro foi gravado"""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+def local_utc_offset(hour: float) -> float:
+    """Offset (em segundos) do fuso local na hora Unix informada"""
+    try:
+        return time.localtime(hour * 3600).tm_gmtoff
+    except (OverflowError, OSError, ValueError):
+        return float('nan')
+
+def timestamps_to_dates(values: pd.Series) -> pd.Series:
+    """Converte timestamps Unix em datas 'YYYY-MM-DD' no fuso local; vazios/inválidos viram ''"""
+    timestamps = pd.to_numeric(values, errors='coerce')
+    timestamps = timestamps.where(timestamps != 0)
+    # O offset do fuso só muda em horas cheias: calcula uma vez por hora distinta
+    hours = timestamps // 3600
+    offsets = {hour: local_utc_offset(hour) for hour in hours.dropna().unique()}
+    local_timestamps = timestamps + hours.map(offsets)
+    dates = pd.to_datetime(local_timestamps, unit='s', errors='coerce').dt.strftime('%Y-%m-%d')
+    return dates.fillna('')
+
+def add_review_flags(df: pd.DataFrame, created: pd.Series, updated: pd.Series) -> pd.DataFrame:
+    """Calcula as flags derivadas das reviews de forma vetorizada, na ordem de REVIEW_COLUMNS"""
+    def numeric(values):
+        return pd.to_numeric(values, errors='coerce')
+
+    word_count = df['review_word_count']
+    df.insert(df.columns.get_loc('updated_date') + 1, 'was_updated', numeric(updated) > numeric(created))
+    df['is_short_review'] = word_count < 10
+    df['is_long_review'] = word_count > 100
+    df['has_engagement'] = (numeric(df['votes_up']) + numeric(df['votes_funny'])) > 0
+    df['is_experienced_reviewer'] = numeric(df['author_num_reviews']) > 10
+    df['is_experienced_gamer'] = numeric(df['author_num_games_owned']) > 50
+    return df
+
+def apply_dtypes(df: pd.DataFrame, dtypes: Dict[str, str]) -> pd.DataFrame:
+    """Converte colunas para dtypes compactos (int32/category) quando os valores comportam"""
+    for col, dtype in dtypes.items():
+        if col not in df:
+            continue
+        values = df[col]
+        # Só inteiros sem nulos e dentro da faixa viram int32
+        if dtype == 'int32' and (values.dtype.kind not in 'iu' or not values.between(INT32_MIN, INT32_MAX).all()):
+            continue
+        df[col] = values.astype(dtype)
+    return df
+
+def round_numeric(values: pd.Series, ndigits: int = 0) -> pd.Series:
+    """Arredonda uma coluna convertendo strings numéricas; inválidos viram NaN"""
+    return pd.to_numeric(values, errors='coerce').round(ndigits)
 
 def extract_genres(genres: List[Dict]) -> List[str]:
     """Extrai lista de gêneros"""
     if not genres:
         return []
-    return [genre.get('description', '') for genre in genres if isinstance(genre, dict)]
+    return [genre.get('description', '') for genre in genres if isinstance(genre, JSON_OBJECT_TYPES)]
 
 def extract_platforms(platforms: Dict) -> Dict[str, bool]:
     """Extrai informações de plataformas"""
@@ -162,214 +355,387 @@ def extract_platforms(platforms: Dict) -> Dict[str, bool]:
         'linux': platforms.get('linux', False)
     }
 
-def clean_game_details(input_file: str, output_file: str, columns=None, export_format='csv'):
-    """Limpa dados de detalhes dos jogos"""
+class ChunkWriter:
+    """Exporta DataFrames em chunks, mantendo o arquivo de saída aberto entre as escritas"""
+
+    def __init__(self, output_file: str, export_format: str = 'csv', columns: Optional[List[str]] = None):
+        self.output_file = output_file
+        self.export_format = export_format
+        self.columns = columns
+        self.rows_written = 0
+        self._handle = None
+        self._writer = None
+        self._schema = None
+
+    def write(self, df: pd.DataFrame):
+        """Grava um chunk no arquivo de saída (o arquivo só é criado no primeiro chunk não vazio)"""
+        # Seleciona colunas se especificado
+        if self.columns:
+            df = df[[col for col in self.columns if col in df.columns]]
+        if df.empty:
+            return
+
+        if self.export_format == 'csv':
+            if self._handle is None:
+                self._handle = open(self.output_file, 'w', encoding='utf-8', newline='')
+                df.to_csv(self._handle, index=False)
+            else:
+                df.to_csv(self._handle, index=False, header=False)
+        else:
+            # Parquet/Feather: cada chunk vira um row group / record batch do mesmo arquivo
+            import pyarrow as pa
+
+            table = pa.Table.from_pandas(df, schema=self._schema, preserve_index=False)
+            if self._writer is None:
+                self._schema = table.schema
+                if self.export_format == 'parquet':
+                    import pyarrow.parquet as pq
+                    self._writer = pq.ParquetWriter(self.output_file, self._schema)
+                else:
+                    self._writer = pa.ipc.new_file(
+                        self.output_file, self._schema,
+                        options=pa.ipc.IpcWriteOptions(compression='lz4')
+                    )
+            self._writer.write_table(table)
+
+        self.rows_written += len(df)
+
+    def close(self):
+        """Fecha o arquivo de saída"""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+def split_file_ranges(input_file: str, range_size: int = RANGE_SIZE) -> List[Tuple[int, int]]:
+    """Divide o arquivo em faixas de bytes (início, fim) alinhadas em quebras de linha"""
+    file_size = os.path.getsize(input_file)
+    ranges = []
+    start = 0
+    with open(input_file, 'rb') as f:
+        while start < file_size:
+            end = start + range_size
+            if end >= file_size:
+                end = file_size
+            else:
+                # Avança até o fim da linha corrente
+                f.seek(end)
+                f.readline()
+                end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+def prefetch_range(input_file: str, start: int, end: int):
+    """Pede ao kernel para ler a faixa em segundo plano (readahead), se suportado"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    fd = os.open(input_file, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, start, end - start, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def read_range_lines(input_file: str, start: int, end: int) -> List[bytes]:
+    """Lê uma faixa de bytes do arquivo e devolve suas linhas"""
+    with open(input_file, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    lines = data.split(b'\n')
+    if lines and not lines[-1]:
+        lines.pop()
+    return lines
+
+def map_file_ranges(func, input_file: str, workers: int = 1):
+    """Aplica func(input_file, início, fim) em cada faixa do arquivo.
+
+    Com workers > 1 as faixas são processadas num pool de processos; os
+    resultados são sempre devolvidos na ordem do arquivo.
+    """
+    ranges = split_file_ranges(input_file, RANGE_SIZE)
+    if workers <= 1:
+        for i, (start, end) in enumerate(ranges):
+            # A leitura da próxima faixa corre no kernel enquanto esta é processada
+            if i + 1 < len(ranges):
+                prefetch_range(input_file, *ranges[i + 1])
+            yield func(input_file, start, end)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Limita as faixas em voo para não acumular resultados na memória
+        pending = deque()
+        for start, end in ranges:
+            pending.append(executor.submit(func, input_file, start, end))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def report_line_errors(errors: List[Dict[str, Any]], line_offset: int) -> List[Dict[str, Any]]:
+    """Ajusta a numeração das linhas com erro de uma faixa e registra no log"""
+    for err in errors:
+        err['line_num'] += line_offset
+        print(f"⚠️ Erro processando linha {err['line_num']}: {err['error']}")
+        logging.warning(f"Erro processando linha {err['line_num']}: {err['error']}")
+    return errors
+
+def build_game_row(game: Dict[str, Any], appid: Any) -> Tuple:
+    """Monta a linha limpa de um jogo (só com valores Python, nenhum proxy do simdjson)"""
+    price_info = extract_price_info(game.get('price_overview'))
+    genres = extract_genres(game.get('genres', []))
+    platforms = extract_platforms(game.get('platforms', {}))
+    release_date = game.get('release_date', {})
+    languages = game.get('supported_languages')
+    release_date_str = release_date.get('date', '') if isinstance(release_date, JSON_OBJECT_TYPES) else ''
+    coming_soon = release_date.get('coming_soon', False) if isinstance(release_date, JSON_OBJECT_TYPES) else False
+    # Mesma ordem de GAME_COLUMNS
+    return (
+        appid,
+        str(game.get('name', '') or '').strip(),
+        str(game.get('type', '') or '').strip(),
+        str(game.get('short_description', '') or '').strip()[:500],
+        price_info['currency'],
+        price_info['original_price'],
+        price_info['final_price'],
+        price_info['discount_percent'],
+        price_info['is_free'],
+        game.get('required_age', 0),
+        ', '.join(genres),
+        len(genres),
+        platforms['windows'],
+        platforms['mac'],
+        platforms['linux'],
+        sum(platforms.values()),
+        release_date_str,
+        coming_soon,
+        ', '.join(game.get('developers', [])) if game.get('developers') else '',
+        ', '.join(game.get('publishers', [])) if game.get('publishers') else '',
+        len(game.get('screenshots', [])),
+        len(game.get('movies', [])),
+        bool(str(game.get('website', '') or '').strip()),
+        str(languages).count(',') + 1 if languages else 0,
+        extract_ids(game.get('categories', [])),
+        extract_ids(game.get('genres', [])),
+    )
+
+def clean_games_range(input_file: str, start: int, end: int) -> Dict[str, Any]:
+    """Limpa uma faixa do arquivo de jogos (roda nos processos do pool)"""
+    categories_map = {}
+    genres_map = {}
+    rows = []
+    errors = []
+    # Deduplicação por appid durante a leitura: duplicados nem chegam ao DataFrame
+    seen_appids = set()
+    duplicates = 0
+    # Com o simdjson o documento é lido sob demanda; cada Parser só aceita um
+    # novo parse depois que o documento anterior deixa de ser referenciado
+    parse = simdjson.Parser().parse if simdjson else json_loads
+    game = None
+    lines = read_range_lines(input_file, start, end)
+    for line_num, line in enumerate(lines, 1):
+        if not line or line.isspace():
+            continue
+        try:
+            game = parse(line)
+            collect_descriptions(game.get('categories', []), categories_map)
+            collect_descriptions(game.get('genres', []), genres_map)
+            appid = game.get('appid')
+            if appid in seen_appids:
+                duplicates += 1
+                continue
+            rows.append(build_game_row(game, appid))
+            seen_appids.add(appid)
+        except Exception as e:
+            errors.append({'line_num': line_num, 'error': str(e), 'line': line.decode('utf-8', 'replace').strip()})
+        finally:
+            game = None
+    return {
+        'df': pd.DataFrame.from_records(rows, columns=GAME_COLUMNS),
+        'categories': categories_map,
+        'genres': genres_map,
+        'duplicates': duplicates,
+        'errors': errors,
+        'lines': len(lines)
+    }
+
+def clean_game_details(input_file: str, output_file: str, columns=None, export_format='csv', workers: int = 1) -> int:
+    """Limpa dados de detalhes dos jogos e retorna quantos jogos foram salvos"""
     logging.info(f"Limpando dados de jogos: {input_file} -> {output_file}")
     print(f"🧹 Limpando dados de jogos: {input_file} -> {output_file}")
-    all_categories = discover_all_categories(input_file)
-    all_genres = discover_all_genres(input_file)
-    logging.info(f"Categorias encontradas: {list(all_categories.values())}")
-    logging.info(f"Gêneros encontrados: {list(all_genres.values())}")
-    print(f"📊 Categorias encontradas: {list(all_categories.values())}")
-    print(f"📊 Gêneros encontrados: {list(all_genres.values())}")
+    # Categorias e gêneros são descobertos na mesma passada da limpeza;
+    # as colunas dinâmicas só são montadas depois de ler o arquivo inteiro
+    all_categories = {}
+    all_genres = {}
 
     cleaned_games = []
-    error_lines = []
-    chunk_size = 10000
-    chunk_games = []
-    with open(input_file, 'r', encoding='utf-8') as f:
-        for line_num, line in enumerate(tqdm(f, desc="Processando jogos"), 1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                game = json.loads(line)
-                price_info = extract_price_info(game.get('price_overview'))
-                categories_info = extract_categories_dynamic(game.get('categories', []), all_categories)
-                genres_info = extract_genres_dynamic(game.get('genres', []), all_genres)
-                genres = extract_genres(game.get('genres', []))
-                platforms = extract_platforms(game.get('platforms', {}))
-                release_date = game.get('release_date', {})
-                release_date_str = release_date.get('date', '') if isinstance(release_date, dict) else ''
-                coming_soon = release_date.get('coming_soon', False) if isinstance(release_date, dict) else False
-                cleaned_game = {
-                    'appid': game.get('appid'),
-                    'name': str(game.get('name', '') or '').strip(),
-                    'type': str(game.get('type', '') or '').strip(),
-                    'short_description': str(game.get('short_description', '') or '').strip()[:500],
-                    'currency': price_info['currency'],
-                    'original_price': price_info['original_price'],
-                    'final_price': price_info['final_price'],
-                    'discount_percent': price_info['discount_percent'],
-                    'is_free': price_info['is_free'],
-                    'required_age': game.get('required_age', 0),
-                    'genres': ', '.join(genres),
-                    'genre_count': len(genres),
-                    'windows': platforms['windows'],
-                    'mac': platforms['mac'],
-                    'linux': platforms['linux'],
-                    'platform_count': sum(platforms.values()),
-                    'release_date': release_date_str,
-                    'coming_soon': coming_soon,
-                    'developers': ', '.join(game.get('developers', [])) if game.get('developers') else '',
-                    'publishers': ', '.join(game.get('publishers', [])) if game.get('publishers') else '',
-                    'screenshot_count': len(game.get('screenshots', [])),
-                    'movie_count': len(game.get('movies', [])),
-                    'has_website': bool(str(game.get('website', '') or '').strip()),
-                    'supported_languages_count': len(str(game.get('supported_languages', '') or '').split(',')) if game.get('supported_languages') else 0
-                }
-                cleaned_game.update(categories_info)
-                cleaned_game.update(genres_info)
-                chunk_games.append(cleaned_game)
-                if len(chunk_games) >= chunk_size:
-                    df_chunk = pd.DataFrame(chunk_games)
-                    df_chunk = df_chunk.drop_duplicates(subset=["appid"])
-                    cleaned_games.append(df_chunk)
-                    chunk_games = []
-            except Exception as e:
-                print(f"⚠️ Erro processando linha {line_num}: {e}")
-                logging.warning(f"Erro processando linha {line_num}: {e}")
-                error_lines.append({'line_num': line_num, 'error': str(e), 'line': line})
-                continue
-    # Processa o último chunk
-    if chunk_games:
-        df_chunk = pd.DataFrame(chunk_games)
-        df_chunk = df_chunk.drop_duplicates(subset=["appid"])
-        cleaned_games.append(df_chunk)
-    if cleaned_games:
+    error_writer = ErrorWriter(output_file)
+    seen_appids = set()
+    duplicates = 0
+    line_offset = 0
+    progress = tqdm(desc="Processando jogos", unit=" linhas")
+    for part in map_file_ranges(clean_games_range, input_file, workers):
+        all_categories.update(part['categories'])
+        all_genres.update(part['genres'])
+        duplicates += part['duplicates']
+        # Remove jogos que já apareceram em faixas anteriores
+        df_part = part['df']
+        repeated = df_part['appid'].isin(seen_appids)
+        if repeated.any():
+            duplicates += int(repeated.sum())
+            df_part = df_part[~repeated]
+        seen_appids.update(df_part['appid'])
+        cleaned_games.append(df_part)
+        error_writer.write(report_line_errors(part['errors'], line_offset))
+        line_offset += part['lines']
+        progress.update(part['lines'])
+    progress.close()
+    after = sum(len(df_part) for df_part in cleaned_games)
+    if after:
         df = pd.concat(cleaned_games, ignore_index=True)
-        before = len(df)
-        df = df.drop_duplicates(subset=["appid"])
-        after = len(df)
-        # Seleciona colunas se especificado
-        if columns:
-            df = df[[col for col in columns if col in df.columns]]
-        # Exporta no formato desejado
-        if export_format == 'csv':
-            df.to_csv(output_file, index=False)
-        elif export_format == 'parquet':
-            df.to_parquet(output_file, index=False)
-        elif export_format == 'feather':
-            df.to_feather(output_file)
-        print(f"✅ {after} jogos limpos salvos em {output_file} (removidos {before-after} duplicados)")
-        logging.info(f"{after} jogos limpos salvos em {output_file} (removidos {before-after} duplicados)")
+        # Libera as faixas já concatenadas para não manter os jogos duas vezes na memória
+        cleaned_games.clear()
+        # Aplicado depois do concat: categorias diferentes entre faixas voltariam a ser object
+        df = apply_dtypes(df, GAME_DTYPES)
+        logging.info(f"Categorias encontradas: {list(all_categories.values())}")
+        logging.info(f"Gêneros encontrados: {list(all_genres.values())}")
+        print(f"📊 Categorias encontradas: {list(all_categories.values())}")
+        print(f"📊 Gêneros encontrados: {list(all_genres.values())}")
+        # pop remove as colunas auxiliares sem copiar o DataFrame inteiro (como o drop)
+        categories_df = build_dummy_columns(df.pop('_category_ids'), all_categories, 'category')
+        genres_df = build_dummy_columns(df.pop('_genre_ids'), all_genres, 'genre')
+        df = pd.concat([df, categories_df, genres_df], axis=1)
+        # As colunas dinâmicas só existem no fim da passada, então os jogos
+        # são exportados de uma vez
+        writer = ChunkWriter(output_file, export_format, columns)
+        writer.write(df)
+        writer.close()
+        print(f"✅ {after} jogos limpos salvos em {output_file} (removidos {duplicates} duplicados)")
+        logging.info(f"{after} jogos limpos salvos em {output_file} (removidos {duplicates} duplicados)")
     else:
         print("❌ Nenhum jogo válido encontrado")
         logging.error("Nenhum jogo válido encontrado")
-    if error_lines:
-        error_file = output_file.replace('.csv', '_errors.jsonl').replace('.parquet', '_errors.jsonl').replace('.feather', '_errors.jsonl')
-        with open(error_file, 'w', encoding='utf-8') as ef:
-            for err in error_lines:
-                ef.write(json.dumps(err, ensure_ascii=False) + '\n')
-        print(f"⚠️ {len(error_lines)} linhas problemáticas salvas em {error_file}")
-        logging.warning(f"{len(error_lines)} linhas problemáticas salvas em {error_file}")
-
-def clean_reviews(input_file: str, output_file: str, columns=None, export_format='csv'):
-    """Limpa dados de reviews"""
+    error_writer.close()
+    if error_writer.errors_written:
+        print(f"⚠️ {error_writer.errors_written} linhas problemáticas salvas em {error_writer.error_file}")
+        logging.warning(f"{error_writer.errors_written} linhas problemáticas salvas em {error_writer.error_file}")
+    return after
+
+def clean_reviews_range(input_file: str, start: int, end: int) -> Dict[str, Any]:
+    """Limpa uma faixa do arquivo de reviews (roda nos processos do pool)"""
+    rows = []
+    errors = []
+    # Deduplicação por recommendationid durante a leitura
+    seen_ids = set()
+    duplicates = 0
+    lines = read_range_lines(input_file, start, end)
+    for line_num, line in enumerate(lines, 1):
+        if not line or line.isspace():
+            continue
+        try:
+            review = json_loads(line)
+            recommendationid = review.get('recommendationid')
+            if recommendationid in seen_ids:
+                duplicates += 1
+                continue
+            author = review.get('author', {})
+            if not isinstance(author, dict):
+                author = {}
+            created_timestamp = review.get('timestamp_created', 0)
+            updated_timestamp = review.get('timestamp_updated', 0)
+            review_text = clean_text(review.get('review', ''))
+            # clean_text já normaliza os espaços: palavras = espaços + 1, sem criar lista
+            word_count = review_text.count(' ') + 1 if review_text else 0
+            char_count = len(review_text)
+
+            # Mesma ordem de REVIEW_ROW_COLUMNS (datas, arredondamentos e flags
+            # são calculados de uma vez só no DataFrame)
+            cleaned_review = (
+                recommendationid,
+                review.get('appid'),
+                review.get('voted_up', False),
+                'Positive' if review.get('voted_up', False) else 'Negative',
+                author.get('steamid', ''),
+                author.get('num_games_owned', 0),
+                author.get('num_reviews', 0),
+                author.get('playtime_forever', 0),
+                author.get('playtime_at_review', 0),
+                review_text[:1000],
+                word_count,
+                char_count,
+                review.get('language', ''),
+                created_timestamp,
+                updated_timestamp,
+                review.get('votes_up', 0),
+                review.get('votes_funny', 0),
+                review.get('comment_count', 0),
+                review.get('weighted_vote_score', 0),
+                review.get('steam_purchase', False),
+                review.get('received_for_free', False),
+                review.get('written_during_early_access', False),
+                review.get('primarily_steam_deck', False),
+            )
+            rows.append(cleaned_review)
+            seen_ids.add(recommendationid)
+        except Exception as e:
+            errors.append({'line_num': line_num, 'error': str(e), 'line': line.decode('utf-8', 'replace').strip()})
+    df = pd.DataFrame.from_records(rows, columns=REVIEW_ROW_COLUMNS)
+    created, updated = df['created_date'], df['updated_date']
+    df['created_date'] = timestamps_to_dates(created)
+    df['updated_date'] = timestamps_to_dates(updated)
+    df = add_review_flags(df, created, updated)
+    df = apply_dtypes(df, REVIEW_DTYPES)
+    df['playtime_forever_hours'] = round_numeric(df['playtime_forever_hours'], 1)
+    df['playtime_at_review_hours'] = round_numeric(df['playtime_at_review_hours'], 1)
+    df['weighted_vote_score'] = round_numeric(df['weighted_vote_score'], 3)
+    return {
+        'df': df,
+        'duplicates': duplicates,
+        'errors': errors,
+        'lines': len(lines)
+    }
+
+def clean_reviews(input_file: str, output_file: str, columns=None, export_format='csv', workers: int = 1) -> int:
+    """Limpa dados de reviews e retorna quantos reviews foram salvos"""
     logging.info(f"Limpando dados de reviews: {input_file} -> {output_file}")
     print(f"🧹 Limpando dados de reviews: {input_file} -> {output_file}")
     
-    cleaned_reviews = []
-    error_lines = []
-    chunk_size = 10000
-    chunk_reviews = []
-    with open(input_file, 'r', encoding='utf-8') as f:
-        for line_num, line in enumerate(tqdm(f, desc="Processando reviews"), 1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                review = json.loads(line)
-                author = review.get('author', {})
-                created_timestamp = review.get('timestamp_created', 0)
-                updated_timestamp = review.get('timestamp_updated', 0)
-                created_date = datetime.fromtimestamp(created_timestamp).strftime('%Y-%m-%d') if created_timestamp else ''
-                updated_date = datetime.fromtimestamp(updated_timestamp).strftime('%Y-%m-%d') if updated_timestamp else ''
-                review_text = clean_text(review.get('review', ''))
-                word_count = len(review_text.split()) if review_text else 0
-                char_count = len(review_text)
-                
-                def safe_round(val, ndigits=0):
-                    try:
-                        if isinstance(val, str):
-                            val = float(val)
-                        return round(val, ndigits)
-                    except Exception:
-                        return val
-
-                cleaned_review = {
-                    'recommendationid': review.get('recommendationid'),
-                    'appid': review.get('appid'),
-                    'voted_up': review.get('voted_up', False),
-                    'recommendation': 'Positive' if review.get('voted_up', False) else 'Negative',
-                    'author_steamid': author.get('steamid', '') if isinstance(author, dict) else '',
-                    'author_num_games_owned': author.get('num_games_owned', 0) if isinstance(author, dict) else 0,
-                    'author_num_reviews': author.get('num_reviews', 0) if isinstance(author, dict) else 0,
-                    'playtime_forever_hours': safe_round(author.get('playtime_forever', 0) if isinstance(author, dict) else 0, 1),
-                    'playtime_at_review_hours': safe_round(author.get('playtime_at_review', 0) if isinstance(author, dict) else 0, 1),
-                    'review_text': review_text[:1000],
-                    'review_word_count': word_count,
-                    'review_char_count': char_count,
-                    'language': review.get('language', ''),
-                    'created_date': created_date,
-                    'updated_date': updated_date,
-                    'was_updated': updated_timestamp > created_timestamp,
-                    'votes_up': review.get('votes_up', 0),
-                    'votes_funny': review.get('votes_funny', 0),
-                    'comment_count': review.get('comment_count', 0),
-                    'weighted_vote_score': safe_round(review.get('weighted_vote_score', 0), 3),
-                    'steam_purchase': review.get('steam_purchase', False),
-                    'received_for_free': review.get('received_for_free', False),
-                    'written_during_early_access': review.get('written_during_early_access', False),
-                    'primarily_steam_deck': review.get('primarily_steam_deck', False),
-                    'is_short_review': word_count < 10,
-                    'is_long_review': word_count > 100,
-                    'has_engagement': (review.get('votes_up', 0) + review.get('votes_funny', 0)) > 0,
-                    'is_experienced_reviewer': (author.get('num_reviews', 0) if isinstance(author, dict) else 0) > 10,
-                    'is_experienced_gamer': (author.get('num_games_owned', 0) if isinstance(author, dict) else 0) > 50
-                }
-                chunk_reviews.append(cleaned_review)
-                if len(chunk_reviews) >= chunk_size:
-                    df_chunk = pd.DataFrame(chunk_reviews)
-                    df_chunk = df_chunk.drop_duplicates(subset=["recommendationid"])
-                    cleaned_reviews.append(df_chunk)
-                    chunk_reviews = []
-            except Exception as e:
-                print(f"⚠️ Erro processando linha {line_num}: {e}")
-                logging.warning(f"Erro processando linha {line_num}: {e}")
-                continue
-    # Processa o último chunk
-    if chunk_reviews:
-        df_chunk = pd.DataFrame(chunk_reviews)
-        df_chunk = df_chunk.drop_duplicates(subset=["recommendationid"])
-        cleaned_reviews.append(df_chunk)
-    if cleaned_reviews:
-        df = pd.concat(cleaned_reviews, ignore_index=True)
-        before = len(df)
-        df = df.drop_duplicates(subset=["recommendationid"])
-        after = len(df)
-        # Seleciona colunas se especificado
-        if columns:
-            df = df[[col for col in columns if col in df.columns]]
-        # Exporta no formato desejado
-        if export_format == 'csv':
-            df.to_csv(output_file, index=False)
-        elif export_format == 'parquet':
-            df.to_parquet(output_file, index=False)
-        elif export_format == 'feather':
-            df.to_feather(output_file)
-        print(f"✅ {after} reviews limpos salvos em {output_file} (removidos {before-after} duplicados)")
-        logging.info(f"{after} reviews limpos salvos em {output_file} (removidos {before-after} duplicados)")
+    error_writer = ErrorWriter(output_file)
+    seen_ids = set()
+    duplicates = 0
+    line_offset = 0
+    writer = ChunkWriter(output_file, export_format, columns)
+    progress = tqdm(desc="Processando reviews", unit=" linhas")
+    for part in map_file_ranges(clean_reviews_range, input_file, workers):
+        duplicates += part['duplicates']
+        # Remove reviews que já apareceram em faixas anteriores e grava a faixa
+        df_part = part['df']
+        repeated = df_part['recommendationid'].isin(seen_ids)
+        if repeated.any():
+            duplicates += int(repeated.sum())
+            df_part = df_part[~repeated]
+        seen_ids.update(df_part['recommendationid'])
+        writer.write(df_part)
+        error_writer.write(report_line_errors(part['errors'], line_offset))
+        line_offset += part['lines']
+        progress.update(part['lines'])
+    progress.close()
+    writer.close()
+    after = writer.rows_written
+    if after:
+        print(f"✅ {after} reviews limpos salvos em {output_file} (removidos {duplicates} duplicados)")
+        logging.info(f"{after} reviews limpos salvos em {output_file} (removidos {duplicates} duplicados)")
     else:
         print("❌ Nenhum review válido encontrado")
         logging.error("Nenhum review válido encontrado")
-    if error_lines:
-        error_file = output_file.replace('.csv', '_errors.jsonl').replace('.parquet', '_errors.jsonl').replace('.feather', '_errors.jsonl')
-        with open(error_file, 'w', encoding='utf-8') as ef:
-            for err in error_lines:
-                ef.write(json.dumps(err, ensure_ascii=False) + '\n')
-        print(f"⚠️ {len(error_lines)} linhas problemáticas salvas em {error_file}")
-        logging.warning(f"{len(error_lines)} linhas problemáticas salvas em {error_file}")
+    error_writer.close()
+    if error_writer.errors_written:
+        print(f"⚠️ {error_writer.errors_written} linhas problemáticas salvas em {error_writer.error_file}")
+        logging.warning(f"{error_writer.errors_written} linhas problemáticas salvas em {error_writer.error_file}")
+    return after
 
 def main():
     parser = argparse.ArgumentParser(
@@ -381,6 +747,7 @@ Exemplos de uso:
   python clean_data.py --skip-reviews --games-format csv
   python clean_data.py --show-categories
   python clean_data.py --show-genres
+  python clean_data.py --workers 4
 """,
         formatter_class=argparse.RawTextHelpFormatter
     )
@@ -408,6 +775,8 @@ Exemplos de uso:
         help='Mostra todas as categorias encontradas nos dados de jogos e encerra')
     parser.add_argument('--show-genres', action='store_true',
         help='Mostra todos os gêneros encontrados nos dados de jogos e encerra')
+    parser.add_argument('--workers', type=int, default=1,
+        help='Processos usados para ler e limpar os JSONL em paralelo. Padrão: 1 (sequencial)')
     parser.add_argument('--log-file', default='logs/clean_data.log', help='Arquivo para salvar logs detalhados (padrão: logs/clean_data.log)')
     parser.add_argument('--log-level', default='INFO', choices=['DEBUG','INFO','WARNING','ERROR'], help='Nível de log (DEBUG, INFO, WARNING, ERROR). Padrão: INFO')
 
@@ -446,32 +815,32 @@ Exemplos de uso:
         return None
 
     print("🧹 Iniciando limpeza de dados do Steam...")
+    games_count = None
+    reviews_count = None
 
     # Limpa dados de jogos
     if not args.skip_games and os.path.exists(args.games_input):
         columns = args.games_columns.split(',') if args.games_columns else None
-        clean_game_details(args.games_input, args.games_output, columns=columns, export_format=args.games_format)
+        games_count = clean_game_details(args.games_input, args.games_output, columns=columns,
+                                         export_format=args.games_format, workers=args.workers)
     elif not args.skip_games:
         print(f"⚠️ Arquivo {args.games_input} não encontrado")
 
     # Limpa dados de reviews
     if not args.skip_reviews and os.path.exists(args.reviews_input):
         columns = args.reviews_columns.split(',') if args.reviews_columns else None
-        clean_reviews(args.reviews_input, args.reviews_output, columns=columns, export_format=args.reviews_format)
+        reviews_count = clean_reviews(args.reviews_input, args.reviews_output, columns=columns,
+                                      export_format=args.reviews_format, workers=args.workers)
     elif not args.skip_reviews:
         print(f"⚠️ Arquivo {args.reviews_input} não encontrado")
 
     print("✅ Limpeza concluída!")
 
-    # Mostra estatísticas
-    if os.path.exists(args.games_output):
-        with open(args.games_output, 'r') as f:
-            games_count = sum(1 for line in f) - 1  # -1 para o cabeçalho
+    # Mostra estatísticas (contagens devolvidas pelas próprias limpezas)
+    if games_count is not None:
         print(f"📊 Jogos limpos: {games_count}")
 
-    if os.path.exists(args.reviews_output):
-        with open(args.reviews_output, 'r') as f:
-            reviews_count = sum(1 for line in f) - 1  # -1 para o cabeçalho
+    if reviews_count is not None:
         print(f"📊 Reviews limpos: {reviews_count}")
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 import logging
@@ -6,8 +7,8 @@ import argparse
 import os
 import random
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Optional, List, Dict, Any, Set
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Optional, List, Dict, Any, Set, Tuple, Union
 import signal
 import sys
 from pathlib import Path
@@ -15,6 +16,33 @@ from collections import deque
 import queue
 import threading
 import csv
+import atexit
+import shutil
+import mmap
+import re
+import io
+import gc
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    def json_dumps_line(obj) -> bytes:
+        # Linha JSONL já em bytes: sem decode para str e re-encode na escrita
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:  # Fallback para a stdlib se o orjson não estiver instalado
+    orjson = None
+    json_loads = json.loads
+
+    def json_dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+    def json_dumps_line(obj) -> bytes:
+        return (json_dumps(obj) + '\n').encode('utf-8')
 
 # =====================================================
 # CONFIGURAÇÃO DE LOCKS E RECURSOS COMPARTILHADOS
@@ -29,6 +57,52 @@ file_lock = threading.Lock()
 # Lock para gerenciamento de proxies
 proxy_lock = threading.Lock()
 
+# Filas das threads escritoras de JSONL (uma por arquivo)
+_jsonl_queues: Dict[str, queue.Queue] = {}
+_jsonl_queues_lock = threading.Lock()
+
+# Arquivos JSONL abertos pelas threads escritoras (ficam abertos até o fim)
+_jsonl_handles: Dict[str, Any] = {}
+
+# CSVs já iniciados nesta execução (cabeçalho decidido na primeira gravação)
+_csv_files_started: Set[str] = set()
+
+# Máximo de records gravados por write() na thread escritora
+JSONL_BATCH_SIZE = 256
+
+# Buffer dos arquivos JSONL mantidos abertos
+JSONL_BUFFER_SIZE = 1024 * 1024
+
+# Entradas pendentes por fila de escrita: com o disco lento, put() bloqueia o worker
+# (back-pressure) em vez de acumular dados sem limite na memória
+JSONL_QUEUE_MAXSIZE = 1024
+
+# "appid" gravado por último em cada record de detalhes (details['appid'] = appid);
+# ancorado no fim da linha para não pegar appids aninhados (demos, fullgame...)
+TRAILING_APPID_RE = re.compile(rb'"appid":(\d+)\}$')
+
+# Validade (s) do cache em disco da lista de apps da Steam
+GAME_LIST_CACHE_TTL = 24 * 3600
+
+# Eventos no log incremental do estado antes de regravar o snapshot completo
+STATE_COMPACT_EVENTS = 10000
+
+# Intervalo mínimo (s) entre checkpoints não forçados do estado
+STATE_SAVE_MIN_INTERVAL = 2.0
+
+# Batches adaptativos do modo paralelo: duração alvo (s), limites de tamanho e
+# erros de request (429/falhas) por task a partir dos quais o próximo batch espera
+BATCH_TARGET_SECONDS = 10
+BATCH_SIZE_MIN = 50
+BATCH_SIZE_MAX = 300
+THROTTLE_ERRORS_PER_TASK = 0.1
+
+# Tasks submetidas e ainda não concluídas, por worker, no modo paralelo
+INFLIGHT_PER_WORKER = 2
+
+# Candidatos embaralhados por jogo ainda necessário (o resto do catálogo fica na ordem original)
+SHUFFLE_OVERSHOOT = 20
+
 # Controle de parada graceful - CORRIGIDO
 stop_processing = threading.Event()
 goal_reached = threading.Event()
@@ -140,6 +214,11 @@ class CursorManager:
         self.cursor_file = cursor_file
         self.progress_file = progress_file or f"{cursor_file}.progress"
         self.backup_file = f"{cursor_file}.backup"
+        # Cache da lista de apps da Steam (resposta bruta da API, válida por GAME_LIST_CACHE_TTL)
+        self.game_list_cache_file = f"{cursor_file}.applist.json"
+        # Log incremental (uma linha por App ID finalizado) aplicado sobre o snapshot
+        self.delta_file = f"{self.progress_file}.delta"
+        self.delta_compacting_file = f"{self.delta_file}.compacting"
         
         # Sets thread-safe para controle de estado
         self.processed_appids: Set[int] = set()
@@ -150,6 +229,13 @@ class CursorManager:
         self.total_games_found = 0
         self.last_batch_index = 0
         
+        # Serializa as gravações do estado em disco (separado do main_lock)
+        self._save_lock = threading.Lock()
+        # Eventos ainda não gravados no log incremental (só vão ao disco depois dos records)
+        self._pending_delta: List[Tuple[int, bool]] = []
+        self._delta_events = 0
+        self._last_save = 0.0
+        
     def load_state(self) -> Dict[str, Any]:
         """Carrega estado completo do cursor com backup automático"""
         state = {
@@ -162,27 +248,29 @@ class CursorManager:
         
         # Tenta carregar arquivo principal primeiro
         for file_path in [self.progress_file, self.backup_file]:
-            if os.path.exists(file_path):
-                try:
-                    with open(file_path, 'r') as f:
-                        data = json.load(f)
-                        state['processed_appids'] = set(data.get('processed_appids', []))
-                        state['reserved_appids'] = set(data.get('reserved_appids', []))
-                        state['failed_appids'] = set(data.get('failed_appids', []))
-                        state['total_games_found'] = data.get('total_games_found', 0)
-                        state['last_batch_index'] = data.get('last_batch_index', 0)
-                        
-                    logger.info(f"✅ Estado carregado de {file_path}: "
-                              f"{len(state['processed_appids'])} processados, "
-                              f"{len(state['reserved_appids'])} reservados, "
-                              f"{state['total_games_found']} jogos encontrados")
-                    break
-                except Exception as e:
-                    logger.warning(f"⚠️ Erro ao carregar {file_path}: {e}")
-                    continue
+            try:
+                data = load_json_file(file_path)
+                state['processed_appids'] = set(map(int, data.get('processed_appids', [])))
+                state['reserved_appids'] = set(map(int, data.get('reserved_appids', [])))
+                state['failed_appids'] = set(map(int, data.get('failed_appids', [])))
+                state['total_games_found'] = data.get('total_games_found', 0)
+                state['last_batch_index'] = data.get('last_batch_index', 0)
+                
+                logger.info(f"✅ Estado carregado de {file_path}: "
+                          f"{len(state['processed_appids'])} processados, "
+                          f"{len(state['reserved_appids'])} reservados, "
+                          f"{state['total_games_found']} jogos encontrados")
+                break
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                logger.warning(f"⚠️ Erro ao carregar {file_path}: {e}")
+                continue
         else:
             logger.info("🆕 Começando com estado limpo")
         
+        self._replay_delta(state)
+        
         self.processed_appids = state['processed_appids']
         self.reserved_appids = state['reserved_appids']
         self.failed_appids = state['failed_appids']
@@ -191,47 +279,132 @@ class CursorManager:
         
         return state
     
+    def _replay_delta(self, state: Dict[str, Any]):
+        """Reaplica sobre o snapshot os eventos do log incremental"""
+        replayed = 0
+        for file_path in [self.delta_compacting_file, self.delta_file]:
+            try:
+                f = open(file_path, 'rb')
+            except FileNotFoundError:
+                continue
+            with f:
+                for line in f:
+                    try:
+                        event = json_loads(line)
+                        appid = int(event['a'])
+                    except (ValueError, KeyError, TypeError):
+                        continue  # Linha incompleta (interrupção no meio da escrita)
+                    state['reserved_appids'].discard(appid)
+                    if event.get('s'):
+                        state['processed_appids'].add(appid)
+                        state['failed_appids'].discard(appid)
+                    else:
+                        state['failed_appids'].add(appid)
+                    replayed += 1
+        if replayed:
+            logger.info(f"🔁 {replayed} eventos reaplicados do log incremental do estado")
+    
+    def _append_delta(self, appid: int, success: bool):
+        """Registra um App ID finalizado para o próximo checkpoint (chamar com main_lock)"""
+        self._pending_delta.append((appid, success))
+    
+    def _write_delta(self, events: List[Tuple[int, bool]]):
+        """Acrescenta eventos ao log incremental e faz fsync (chamar com _save_lock)"""
+        if not events:
+            return
+        payload = ''.join(json_dumps({'a': appid, 's': success}) + '\n' for appid, success in events)
+        with open(self.delta_file, 'ab') as f:
+            f.write(payload.encode('utf-8'))
+            f.flush()
+            try:
+                os.fsync(f.fileno())
+            except OSError as e:
+                logger.warning(f"⚠️ Erro no fsync de {self.delta_file}: {e}")
+    
+    def _rotate_delta(self):
+        """Move o log incremental para o arquivo de compactação (chamar com _save_lock)"""
+        if not os.path.exists(self.delta_file):
+            return
+        if os.path.exists(self.delta_compacting_file):
+            # Compactação anterior falhou: junta os eventos para não perder nenhum
+            with open(self.delta_compacting_file, 'ab') as dst, open(self.delta_file, 'rb') as src:
+                shutil.copyfileobj(src, dst)
+            os.remove(self.delta_file)
+        else:
+            os.replace(self.delta_file, self.delta_compacting_file)
+    
     def save_state(self, force: bool = False):
-        """Salva estado com backup automático e operação atômica"""
-        with main_lock:
+        """Salva estado: checkpoint do log incremental ou snapshot completo (force/compactação)"""
+        # Checkpoints em sequência rápida se fundem: o próximo cobre os eventos deste
+        if not force and time.monotonic() - self._last_save < STATE_SAVE_MIN_INTERVAL:
+            return
+        with self._save_lock:
+            self._last_save = time.monotonic()
+            # Captura eventos/estado ANTES de drenar os writers: os records de todo App ID
+            # capturado já estão enfileirados, então chegam ao disco antes do estado
+            with main_lock:
+                events = self._pending_delta
+                self._pending_delta = []
+                self._delta_events += len(events)
+                compact = force or self._delta_events >= STATE_COMPACT_EVENTS
+                if compact:
+                    # Só a cópia do estado segura o main_lock; a escrita em disco não bloqueia as reservas
+                    state = {
+                        'processed_appids': list(self.processed_appids),
+                        'reserved_appids': list(self.reserved_appids),
+                        'failed_appids': list(self.failed_appids),
+                        'total_games_found': self.total_games_found,
+                        'last_batch_index': self.last_batch_index,
+                        'timestamp': time.time()
+                    }
+            flush_jsonl_writers()
+            for filename in list(_jsonl_queues):
+                checkpoint_fsync(filename)
+            if not compact:
+                self._write_delta(events)
+                return
             try:
-                state = {
-                    'processed_appids': list(self.processed_appids),
-                    'reserved_appids': list(self.reserved_appids),
-                    'failed_appids': list(self.failed_appids),
-                    'total_games_found': self.total_games_found,
-                    'last_batch_index': self.last_batch_index,
-                    'timestamp': time.time()
-                }
+                # Os eventos capturados já estão no snapshot; o log atual vira o de compactação
+                self._rotate_delta()
                 
                 # 1. Salva backup do arquivo atual
-                if os.path.exists(self.progress_file):
-                    try:
-                        os.replace(self.progress_file, self.backup_file)
-                    except Exception as e:
-                        logger.warning(f"⚠️ Erro ao criar backup: {e}")
+                try:
+                    os.replace(self.progress_file, self.backup_file)
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    logger.warning(f"⚠️ Erro ao criar backup: {e}")
                 
-                # 2. Salva em arquivo temporário
-                temp_file = f"{self.progress_file}.tmp"
-                with open(temp_file, 'w') as f:
-                    json.dump(state, f, indent=2)
+                # 2. Escrita atômica do snapshot (o destino foi movido para o backup acima)
+                # JSON compacto: o arquivo é só para o scraper, sem indentação
+                write_file_atomic(self.progress_file, json_dumps(state))
+                self._delta_events = 0
                 
-                # 3. Move arquivo temporário (operação atômica)
-                os.replace(temp_file, self.progress_file)
+                # 3. Os eventos compactados já estão no snapshot
+                try:
+                    os.remove(self.delta_compacting_file)
+                except FileNotFoundError:
+                    pass
                 
                 if force:
-                    logger.info(f"💾 Estado salvo: {len(self.processed_appids)} processados, "
-                              f"{len(self.reserved_appids)} reservados")
+                    logger.info(f"💾 Estado salvo: {len(state['processed_appids'])} processados, "
+                              f"{len(state['reserved_appids'])} reservados")
                     
             except Exception as e:
                 logger.error(f"❌ ERRO CRÍTICO ao salvar estado: {e}")
+                # Mantém os eventos capturados no log para o próximo checkpoint/retomada
+                try:
+                    self._write_delta(events)
+                except OSError:
+                    pass
                 # Tenta restaurar backup se algo deu errado
-                if os.path.exists(self.backup_file):
-                    try:
-                        os.replace(self.backup_file, self.progress_file)
-                        logger.info("🔄 Backup restaurado")
-                    except Exception as restore_e:
-                        logger.error(f"❌ Erro ao restaurar backup: {restore_e}")
+                try:
+                    os.replace(self.backup_file, self.progress_file)
+                    logger.info("🔄 Backup restaurado")
+                except FileNotFoundError:
+                    pass
+                except Exception as restore_e:
+                    logger.error(f"❌ Erro ao restaurar backup: {restore_e}")
     
     def reserve_appid(self, appid: int) -> bool:
         """RESERVA App ID de forma atômica - THREAD-SAFE"""
@@ -253,6 +426,7 @@ class CursorManager:
             # Remove da reserva
             self.reserved_appids.discard(appid)
             
+            self._append_delta(appid, success)
             if success:
                 self.processed_appids.add(appid)
                 self.failed_appids.discard(appid)
@@ -268,19 +442,19 @@ class CursorManager:
             self.reserved_appids.discard(appid)
             logger.debug(f"🔓 Reserva liberada para App ID {appid}")
     
-    def get_remaining_games(self, all_games: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Retorna jogos não processados, não reservados e não falhados"""
-        remaining = []
-        all_blocked = self.processed_appids | self.reserved_appids
+    def get_remaining_games(self, games_by_id: Dict[int, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Retorna jogos não processados, não reservados e não falhados (índice appid -> jogo)"""
+        by_id = games_by_id
         
-        for game in all_games:
-            appid = game.get('appid')
-            if appid and appid not in all_blocked:
-                remaining.append(game)
+        # Diferença de conjuntos feita em C; ordena por appid para manter a saída determinística.
+        # Os falhados também saem aqui: reserve_appid os recusaria de qualquer forma
+        available_ids = by_id.keys() - self.processed_appids - self.reserved_appids - self.failed_appids
+        remaining = [by_id[appid] for appid in sorted(available_ids)]
         
-        logger.info(f"📋 Jogos restantes: {len(remaining)}/{len(all_games)} "
+        logger.info(f"📋 Jogos restantes: {len(remaining)}/{len(by_id)} "
                    f"(Processados: {len(self.processed_appids)}, "
-                   f"Reservados: {len(self.reserved_appids)})")
+                   f"Reservados: {len(self.reserved_appids)}, "
+                   f"Falhados: {len(self.failed_appids)})")
         return remaining
 
 # =====================================================
@@ -297,6 +471,11 @@ class ThreadSafeCounter:
     
     def increment(self) -> tuple[bool, int]:
         """Incrementa contador se não exceder limite. Retorna (sucesso, valor_atual)"""
+        # Caminho rápido sem lock: com a meta atingida todas as threads recusam de cara
+        # (a leitura de um int é atômica; a confirmação continua sob o lock)
+        max_value = self._max_value
+        if max_value and self._value >= max_value:
+            return False, self._value
         with self._lock:
             if self._max_value and self._value >= self._max_value:
                 return False, self._value
@@ -311,9 +490,8 @@ class ThreadSafeCounter:
     
     @property
     def value(self) -> int:
-        """Obtém valor atual (thread-safe)"""
-        with self._lock:
-            return self._value
+        """Obtém valor atual (leitura sem lock: o int publicado é trocado atomicamente)"""
+        return self._value
     
     def set_max(self, max_value: int):
         """Define valor máximo"""
@@ -321,14 +499,93 @@ class ThreadSafeCounter:
             self._max_value = max_value
     
     def reached_limit(self) -> bool:
-        """Verifica se atingiu limite"""
-        with self._lock:
-            return self._max_value and self._value >= self._max_value
+        """Verifica se atingiu limite (sem lock; increment revalida sob o lock)"""
+        max_value = self._max_value
+        return max_value and self._value >= max_value
 
 # =====================================================
 # UTILS OTIMIZADOS
 # =====================================================
 
+# Sessão HTTP compartilhada: reaproveita conexões keep-alive (sem novo handshake TLS
+# por request). O retry continua em make_request, então o adapter não repete nada.
+HTTP_POOL_SIZE = 64
+# Pools por host mantidos pelo adapter (store/api.steampowered.com, com folga)
+HTTP_POOL_HOSTS = 4
+# Workers são só espera de rede: o teto acompanha o pool de conexões da sessão
+# (o ritmo de reviews escala por worker, então mais workers rendem mais throughput)
+MAX_WORKERS = HTTP_POOL_SIZE
+http_session = requests.Session()
+
+def configure_http_pool(workers: int):
+    """Monta o adapter da sessão com até `workers` conexões keep-alive por host"""
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_HOSTS, pool_maxsize=workers, max_retries=0)
+    # Fecha os adapters substituídos (inclusive os padrão da Session) antes de montar o novo
+    for old_adapter in {id(a): a for a in http_session.adapters.values()}.values():
+        old_adapter.close()
+    http_session.mount('https://', adapter)
+    http_session.mount('http://', adapter)
+
+configure_http_pool(HTTP_POOL_SIZE)
+
+# Ritmo das páginas de reviews (páginas/s e rajada) e duração da penalidade após 429
+# Ritmo de páginas de review por worker (o baseline dormia 0,2s entre páginas em cada thread)
+REVIEW_PAGES_PER_WORKER = 5
+# Rajada permitida, em segundos de taxa acumulada
+REVIEW_BURST_SECONDS = 2
+RATE_LIMIT_PENALTY_SECONDS = 30
+
+class TokenBucket:
+    """Limitador de taxa token bucket compartilhado entre as threads"""
+    
+    def __init__(self, rate: float, capacity: float, penalty_seconds: float = RATE_LIMIT_PENALTY_SECONDS):
+        self.rate = rate
+        self.capacity = capacity
+        self.penalty_seconds = penalty_seconds
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._penalty_until = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Consome um token, esperando só o necessário quando o balde está vazio"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                # Taxa cai pela metade enquanto durar a penalidade de rate limit
+                rate = self.rate / 2 if now < self._penalty_until else self.rate
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / rate
+            time.sleep(wait)
+    
+    def configure(self, rate: float, capacity: float):
+        """Ajusta taxa e rajada (ex.: ao definir o número de workers)"""
+        with self._lock:
+            self.rate = rate
+            self.capacity = capacity
+            self._tokens = min(float(capacity), self._tokens)
+            self._last = time.monotonic()
+    
+    def penalize(self):
+        """Reduz a taxa à metade por penalty_seconds (chamado ao receber 429)"""
+        with self._lock:
+            self._penalty_until = time.monotonic() + self.penalty_seconds
+
+_review_bucket = TokenBucket(rate=REVIEW_PAGES_PER_WORKER,
+                             capacity=REVIEW_PAGES_PER_WORKER * REVIEW_BURST_SECONDS)
+
+def configure_review_rate(workers: int):
+    """Escala o limitador de páginas de review com o número de workers"""
+    rate = REVIEW_PAGES_PER_WORKER * workers
+    _review_bucket.configure(rate, rate * REVIEW_BURST_SECONDS)
+
+# Tentativas com 429 ou erro de rede/HTTP (lido pelo modo paralelo para recuar)
+request_errors = ThreadSafeCounter()
+
 def make_request(url: str, params: Optional[Dict] = None, timeout: int = 15, 
                 proxies: Optional[Dict] = None, retries: int = 3) -> Optional[requests.Response]:
     """Request com retry exponential backoff otimizado"""
@@ -340,10 +597,12 @@ def make_request(url: str, params: Optional[Dict] = None, timeout: int = 15,
             return None
         try:
             logger.debug(f"🔎 [Tentativa {attempt+1}] Fazendo request para {url} com timeout 7s...")
-            response = requests.get(url, params=params, timeout=timeout, 
-                                  proxies=proxies, allow_redirects=True)
+            response = http_session.get(url, params=params, timeout=timeout, 
+                                        proxies=proxies, allow_redirects=True)
             logger.debug(f"🔎 [Tentativa {attempt+1}] Request finalizado para {url} - status {response.status_code}")
             if response.status_code == 429:
+                request_errors.increment()
+                _review_bucket.penalize()
                 # Espera fixa de 2 minutos em caso de rate limit
                 wait_time = 40
                 logger.warning(f"⏱️ Rate limit - aguardando {wait_time}s (tentativa {attempt+1})")
@@ -352,6 +611,7 @@ def make_request(url: str, params: Optional[Dict] = None, timeout: int = 15,
             response.raise_for_status()
             return response
         except requests.RequestException as e:
+            request_errors.increment()
             logger.debug(f"🔌 [Tentativa {attempt+1}] RequestException: {e}")
             if attempt == retries - 1:
                 logger.debug(f"🔌 Request falhou após {retries} tentativas: {e}")
@@ -360,22 +620,136 @@ def make_request(url: str, params: Optional[Dict] = None, timeout: int = 15,
             time.sleep(min(2 ** attempt, 10))
     return None
 
+def _jsonl_writer_loop(filename: str, records: queue.Queue):
+    """Thread escritora: drena a fila e grava vários records em um único write()"""
+    handle = None
+    while True:
+        batch = [records.get()]
+        while len(batch) < JSONL_BATCH_SIZE:
+            try:
+                batch.append(records.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            if handle is None:
+                # Binário: as linhas chegam prontas em bytes (JSONL com \n, CSV com \r\n)
+                handle = open(filename, 'ab', buffering=JSONL_BUFFER_SIZE)
+                _jsonl_handles[filename] = handle
+            handle.write(b''.join(batch))
+            # O arquivo continua aberto; o flush por lote entrega os dados ao SO
+            handle.flush()
+        except Exception as e:
+            logger.error(f"❌ Erro ao salvar {len(batch)} records em {filename}: {e}")
+        finally:
+            for _ in batch:
+                records.task_done()
+
+def _get_jsonl_queue(filename: str) -> queue.Queue:
+    """Retorna a fila do arquivo, iniciando sua thread escritora na primeira vez"""
+    records = _jsonl_queues.get(filename)
+    if records is None:
+        with _jsonl_queues_lock:
+            records = _jsonl_queues.get(filename)
+            if records is None:
+                records = queue.Queue(maxsize=JSONL_QUEUE_MAXSIZE)
+                threading.Thread(target=_jsonl_writer_loop, args=(filename, records),
+                                 name="JsonlWriter", daemon=True).start()
+                _jsonl_queues[filename] = records
+    return records
+
+@atexit.register
+def _close_jsonl_handles():
+    """Fecha os arquivos JSONL mantidos abertos pelas threads escritoras"""
+    for handle in list(_jsonl_handles.values()):
+        try:
+            handle.close()
+        except Exception:
+            pass
+
+def flush_jsonl_writers():
+    """Aguarda as threads escritoras gravarem todos os records enfileirados"""
+    for records in list(_jsonl_queues.values()):
+        records.join()
+
+def load_json_file(file_path: str) -> Any:
+    """Carrega um arquivo JSON via mmap (com orjson o parse lê direto das páginas mapeadas)"""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError(f"Arquivo vazio: {file_path}")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if orjson is None:
+                return json_loads(mm[:])
+            with memoryview(mm) as view:
+                return json_loads(view)
+
+def checkpoint_fsync(filename: str):
+    """Força a gravação física do arquivo (um fsync por checkpoint, não por record)"""
+    try:
+        fd = os.open(filename, os.O_WRONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError as e:
+        logger.warning(f"⚠️ Erro no fsync de {filename}: {e}")
+    finally:
+        os.close(fd)
+
+def write_file_atomic(filename: str, content: Union[str, bytes]):
+    """Escreve o arquivo de forma atômica: O_TMPFILE + link no Linux, temp + os.replace nos demais"""
+    data = content.encode('utf-8') if isinstance(content, str) else content
+    if hasattr(os, 'O_TMPFILE'):
+        try:
+            # Arquivo anônimo no diretório de destino: só ganha nome quando está completo
+            fd = os.open(os.path.dirname(filename) or '.', os.O_TMPFILE | os.O_WRONLY, 0o644)
+        except OSError:
+            fd = None  # Sistema de arquivos sem suporte a O_TMPFILE
+        if fd is not None:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                # Nome temporário único + os.replace: funciona também quando o destino já existe
+                proc_path = f"/proc/self/fd/{fd}"
+                temp_link = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+                try:
+                    try:
+                        os.link(proc_path, temp_link)
+                    except FileExistsError:
+                        os.remove(temp_link)  # Sobra de uma execução interrompida
+                        os.link(proc_path, temp_link)
+                except OSError:
+                    pass  # /proc indisponível: usa o caminho tradicional
+                else:
+                    os.replace(temp_link, filename)
+                    return
+    
+    temp_file = f"{filename}.tmp"
+    with open(temp_file, 'wb') as f:
+        f.write(data)
+    os.replace(temp_file, filename)
+
 def safe_save_jsonl(record: Dict[str, Any], filename: str) -> bool:
-    """Salva record em JSONL com lock thread-safe e verificação de integridade"""
-    with file_lock:
+    """Enfileira record para a thread escritora do JSONL (serializa antes para validar)"""
+    try:
+        # Serializa primeiro para validar JSON
+        json_line = json_dumps_line(record)
+    except Exception as e:
+        logger.error(f"❌ Erro ao salvar em {filename}: {e}")
+        return False
+    _get_jsonl_queue(filename).put(json_line)
+    return True
+
+def safe_save_jsonl_batch(records: List[Dict[str, Any]], filename: str) -> int:
+    """Enfileira vários records de uma vez (uma única entrada na fila). Retorna quantos foram salvos"""
+    lines = []
+    for record in records:
         try:
-            # Serializa primeiro para validar JSON
-            json_record = json.dumps(record, ensure_ascii=False, separators=(',', ':'))
-            
-            # Salva com newline
-            with open(filename, 'a', encoding='utf-8') as f:
-                f.write(json_record + '\n')
-                f.flush()  # Force write to disk
-            
-            return True
+            lines.append(json_dumps_line(record))
         except Exception as e:
             logger.error(f"❌ Erro ao salvar em {filename}: {e}")
-            return False
+    if lines:
+        _get_jsonl_queue(filename).put(b''.join(lines))
+    return len(lines)
 
 def flatten_dict(d: Dict[str, Any], parent_key: str = '', sep: str = '_') -> Dict[str, Any]:
     """Achata dicionário aninhado para CSV"""
@@ -397,54 +771,70 @@ def flatten_dict(d: Dict[str, Any], parent_key: str = '', sep: str = '_') -> Dic
     return dict(items)
 
 def safe_save_csv(record: Dict[str, Any], filename: str, is_review: bool = False) -> bool:
-    """Salva record em CSV com cabeçalho automático"""
+    """Salva record em CSV com cabeçalho automático (gravação pela thread escritora)"""
+    return safe_save_csv_batch([record], filename, is_review) == 1
+
+def safe_save_csv_batch(records: List[Dict[str, Any]], filename: str, is_review: bool = False) -> int:
+    """Formata os records como linhas CSV e as enfileira de uma vez. Retorna quantos foram salvos"""
+    buffer = io.StringIO()
+    saved = 0
+    # O lock mantém cabeçalho e linhas na ordem em que entram na fila
     with file_lock:
-        try:
-            # Achata o dicionário para CSV
-            flat_record = flatten_dict(record)
-            
-            # Verifica se arquivo existe para decidir se escreve cabeçalho
-            file_exists = os.path.exists(filename)
-            
-            with open(filename, 'a', newline='', encoding='utf-8') as f:
+        # Cabeçalho só se o arquivo não existia antes da primeira gravação desta execução
+        write_header = filename not in _csv_files_started and not os.path.exists(filename)
+        _csv_files_started.add(filename)
+        for record in records:
+            try:
+                # Achata o dicionário para CSV
+                flat_record = flatten_dict(record)
                 if flat_record:
-                    writer = csv.DictWriter(f, fieldnames=flat_record.keys())
-                    
-                    # Escreve cabeçalho se arquivo não existe
-                    if not file_exists:
+                    writer = csv.DictWriter(buffer, fieldnames=flat_record.keys())
+                    if write_header:
                         writer.writeheader()
-                    
+                        write_header = False
                     writer.writerow(flat_record)
-                    f.flush()
-            
-            return True
-        except Exception as e:
-            logger.error(f"❌ Erro ao salvar CSV em {filename}: {e}")
-            return False
+                saved += 1
+            except Exception as e:
+                logger.error(f"❌ Erro ao salvar CSV em {filename}: {e}")
+        if buffer.tell():
+            _get_jsonl_queue(filename).put(buffer.getvalue().encode('utf-8'))
+    return saved
 
 def get_existing_appids(filename: str) -> Set[int]:
     """Extrai App IDs existentes com validação robusta"""
     appids = set()
-    if not os.path.exists(filename):
+    try:
+        f = open(filename, 'rb')
+    except FileNotFoundError:
         return appids
     
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            line_count = 0
-            for line in f:
-                line_count += 1
-                line = line.strip()
-                if not line:
-                    continue
-                    
-                try:
-                    record = json.loads(line)
-                    appid = record.get('appid')
-                    if appid and isinstance(appid, int):
-                        appids.add(appid)
-                except json.JSONDecodeError as e:
-                    logger.warning(f"⚠️ Linha {line_count} inválida em {filename}: {e}")
-                    continue
+        with f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return appids
+            # Lê as linhas direto do arquivo mapeado, sem buffers intermediários de texto
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for line_count, line in enumerate(iter(mm.readline, b''), 1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                        
+                    # Caminho rápido: procura o appid só nos últimos bytes da linha, sem parsear o record
+                    match = TRAILING_APPID_RE.search(line, max(0, len(line) - 32))
+                    if match:
+                        appid = int(match.group(1))
+                        if appid:
+                            appids.add(appid)
+                        continue
+                        
+                    try:
+                        record = json_loads(line)
+                        appid = record.get('appid')
+                        if appid and isinstance(appid, int):
+                            appids.add(appid)
+                    except json.JSONDecodeError as e:
+                        logger.warning(f"⚠️ Linha {line_count} inválida em {filename}: {e}")
+                        continue
         
         logger.info(f"📊 {len(appids)} App IDs existentes em {filename}")
         
@@ -457,17 +847,37 @@ def get_existing_appids(filename: str) -> Set[int]:
 # STEAM API OTIMIZADA
 # =====================================================
 
-def get_all_game_list() -> List[Dict[str, Any]]:
-    """Obtém lista completa de jogos com retry robusto"""
+def get_all_game_list(cache_file: Optional[str] = None, refresh: bool = False) -> List[Dict[str, Any]]:
+    """Obtém lista completa de jogos com retry robusto (usa o cache em disco se recente)"""
+    if cache_file and not refresh:
+        try:
+            age = time.time() - os.path.getmtime(cache_file)
+            if age < GAME_LIST_CACHE_TTL:
+                apps = load_json_file(cache_file).get('applist', {}).get('apps', [])
+                if apps:
+                    logger.info(f"📦 {len(apps)} jogos carregados do cache ({age / 3600:.1f}h)")
+                    return apps
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"⚠️ Cache da lista de jogos inválido, baixando novamente: {e}")
+    
     url = "https://api.steampowered.com/ISteamApps/GetAppList/v2"
     
     for attempt in range(3):
         response = make_request(url, timeout=30, retries=2)
         if response:
             try:
-                data = response.json()
+                # Payload de dezenas de MB: orjson direto dos bytes, sem o decode de texto do requests
+                data = json_loads(response.content)
                 apps = data.get('applist', {}).get('apps', [])
                 logger.info(f"📦 {len(apps)} jogos obtidos da Steam API")
+                if cache_file and apps:
+                    # Guarda os bytes recebidos: o próximo início não precisa baixar de novo
+                    try:
+                        write_file_atomic(cache_file, response.content)
+                    except OSError as e:
+                        logger.warning(f"⚠️ Erro ao salvar cache da lista de jogos: {e}")
                 return apps
             except (json.JSONDecodeError, KeyError) as e:
                 logger.error(f"❌ Erro ao processar resposta da API: {e}")
@@ -482,13 +892,16 @@ def get_all_game_list() -> List[Dict[str, Any]]:
 
 def get_app_details(appid: int, proxy_manager: ProxyManager) -> Optional[Dict[str, Any]]:
     """Obtém detalhes com pool de proxies otimizado"""
-    if goal_reached.is_set() or stop_processing.is_set():
+    # Métodos das flags resolvidos uma vez, fora do loop de tentativas
+    stop_is_set = stop_processing.is_set
+    goal_is_set = goal_reached.is_set
+    if goal_is_set() or stop_is_set():
         return None
         
     url = f"https://store.steampowered.com/api/appdetails?appids={appid}&cc=us&l=english"
     
     for attempt in range(4):  # Máximo 4 tentativas
-        if stop_processing.is_set() or goal_reached.is_set():
+        if stop_is_set() or goal_is_set():
             return None
         
         proxy = proxy_manager.get_proxy()
@@ -499,7 +912,7 @@ def get_app_details(appid: int, proxy_manager: ProxyManager) -> Optional[Dict[st
         
         if response:
             try:
-                data = response.json()
+                data = json_loads(response.content)
                 app_data = data.get(str(appid))
                 
                 if app_data and app_data.get('success'):
@@ -521,7 +934,10 @@ def get_app_details(appid: int, proxy_manager: ProxyManager) -> Optional[Dict[st
 
 def get_app_reviews(appid: int, num_reviews: int, proxy_manager: ProxyManager) -> List[Dict[str, Any]]:
     """Obtém reviews com paginação eficiente"""
-    if goal_reached.is_set() or stop_processing.is_set():
+    # Métodos das flags resolvidos uma vez, fora do loop de páginas
+    stop_is_set = stop_processing.is_set
+    goal_is_set = goal_reached.is_set
+    if goal_is_set() or stop_is_set():
         return []
         
     reviews = []
@@ -529,8 +945,11 @@ def get_app_reviews(appid: int, num_reviews: int, proxy_manager: ProxyManager) -
     max_pages = min(10, (num_reviews + 99) // 100)  # Limita páginas
     
     for page in range(max_pages):
-        if stop_processing.is_set() or goal_reached.is_set() or len(reviews) >= num_reviews:
+        if stop_is_set() or goal_is_set() or len(reviews) >= num_reviews:
             break
+        
+        # Ritmo compartilhado entre as threads no lugar da pausa fixa entre páginas
+        _review_bucket.acquire()
             
         proxy = proxy_manager.get_proxy()
         proxy_config = proxy_manager.get_proxy_config(proxy)
@@ -549,7 +968,7 @@ def get_app_reviews(appid: int, num_reviews: int, proxy_manager: ProxyManager) -
         
         if response:
             try:
-                data = response.json()
+                data = json_loads(response.content)
                 if data.get('success') and data.get('reviews'):
                     new_reviews = data['reviews']
                     reviews.extend(new_reviews)
@@ -566,11 +985,11 @@ def get_app_reviews(appid: int, num_reviews: int, proxy_manager: ProxyManager) -
             if proxy:
                 proxy_manager.mark_failed(proxy)
             break
-            
-        # Pausa entre requests de reviews
-        time.sleep(0.2)
     
-    return reviews[:num_reviews]
+    # Corta o excedente no lugar, sem copiar a lista inteira num slice
+    if len(reviews) > num_reviews:
+        del reviews[num_reviews:]
+    return reviews
 
 # =====================================================
 # PROCESSAMENTO CORRIGIDO E THREAD-SAFE
@@ -648,15 +1067,14 @@ def processar_um_jogo(app: Dict[str, Any], proxy_manager: ProxyManager,
         if args.max_reviews > 0 and not goal_reached.is_set():
             reviews = get_app_reviews(appid, args.max_reviews, proxy_manager)
             
-            for review in reviews:
-                if stop_processing.is_set() or goal_reached.is_set():
-                    break
-                review['appid'] = appid
-                if safe_save_jsonl(review, game_reviews_file):
-                    reviews_saved += 1
-                    # Salva review em CSV se a flag estiver ativa
-                    if args.csv and game_reviews_csv:
-                        safe_save_csv(review, game_reviews_csv, is_review=True)
+            if reviews and not (stop_processing.is_set() or goal_reached.is_set()):
+                for review in reviews:
+                    review['appid'] = appid
+                # Todos os reviews do jogo vão para o JSONL numa única gravação
+                reviews_saved = safe_save_jsonl_batch(reviews, game_reviews_file)
+                # Salva reviews em CSV se a flag estiver ativa
+                if args.csv and game_reviews_csv:
+                    safe_save_csv_batch(reviews, game_reviews_csv, is_review=True)
             
             logger.info(f"📝 {reviews_saved} reviews salvos para {appid}")
         
@@ -689,15 +1107,23 @@ def _is_valid_game(details: Dict[str, Any]) -> bool:
     if not details.get('name'):
         return False
         
-    # Não deve ser DLC
-    categories = details.get('categories', [])
-    if any(cat.get('id') == 21 for cat in categories if isinstance(cat, dict)):
-        return False
+    # Não deve ser DLC (loop simples: sem gerador por chamada)
+    for cat in details.get('categories') or ():
+        if isinstance(cat, dict) and cat.get('id') == 21:
+            return False
         
     # Filtros adicionais de qualidade podem ser adicionados aqui
     
     return True
 
+def partial_shuffle(items: List[Any], k: int):
+    """Fisher–Yates parcial in-place: só as k primeiras posições recebem amostra aleatória"""
+    n = len(items)
+    randrange = random.randrange
+    for i in range(min(k, n - 1)):
+        j = randrange(i, n)
+        items[i], items[j] = items[j], items[i]
+
 # =====================================================
 # PROGRESS TRACKER OTIMIZADO
 # =====================================================
@@ -712,11 +1138,16 @@ class ProgressTracker:
         self._lock = threading.Lock()
         
     def update(self, games_found: int, apps_processed: int = None):
-        """Atualiza e exibe progresso (thread-safe)"""
+        """Atualiza e exibe progresso (thread-safe, descartável: nunca espera)"""
         current_time = time.time()
+        if current_time - self.last_update <= 20:  # Update a cada 20s
+            return
         
-        with self._lock:
-            if current_time - self.last_update > 20:  # Update a cada 20s
+        # Telemetria não é essencial: se outra thread já está atualizando, descarta
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            if current_time - self.last_update > 20:
                 elapsed = current_time - self.start_time
                 
                 if games_found > 0:
@@ -731,6 +1162,8 @@ class ProgressTracker:
                               f"ETA: {eta_minutes:.0f}min")
                 
                 self.last_update = current_time
+        finally:
+            self._lock.release()
 
 # =====================================================
 # FUNÇÃO PRINCIPAL CORRIGIDA
@@ -749,6 +1182,7 @@ def main(args=None):
         parser.add_argument('--max_reviews', type=int, default=10, help='Reviews por jogo')
         parser.add_argument('--cursor_file', type=str, default='data/state/scraper_cursor.txt')
         parser.add_argument('--reset_cursor', action='store_true', help='Reseta cursor e recomeça')
+        parser.add_argument('--refresh_game_list', action='store_true', help='Ignora o cache da lista de jogos (24h) e baixa novamente')
         parser.add_argument('--game_details_file', type=str, default='data/json/game_details.jsonl')
         parser.add_argument('--game_reviews_file', type=str, default='data/json/game_reviews.jsonl')
         parser.add_argument('--csv', action='store_true', help='Salva dados também em formato CSV')
@@ -786,10 +1220,14 @@ def main(args=None):
     # Validação e ajuste de argumentos
     args.max_games = max(1, args.max_games)
     args.max_reviews = max(0, args.max_reviews)
-    args.workers = max(1, min(20, args.workers))
+    args.workers = max(1, min(MAX_WORKERS, args.workers))
     args.checkpoint_interval = max(5, args.checkpoint_interval)
     args.batch_size = max(50, min(150, args.batch_size))  # Limita batch size
     
+    # Pool HTTP e ritmo de reviews do tamanho da concorrência real (o modo sequencial usa uma conexão)
+    configure_http_pool(args.workers if args.parallel else 1)
+    configure_review_rate(args.workers if args.parallel else 1)
+    
     # Define nomes dos arquivos CSV baseados nos arquivos JSONL
     game_details_csv = None
     game_reviews_csv = None
@@ -808,10 +1246,13 @@ def main(args=None):
     
     # Reset cursor se solicitado
     if args.reset_cursor:
-        for file in [cursor_manager.cursor_file, cursor_manager.progress_file, cursor_manager.backup_file]:
-            if os.path.exists(file):
+        for file in [cursor_manager.cursor_file, cursor_manager.progress_file, cursor_manager.backup_file,
+                     cursor_manager.delta_file, cursor_manager.delta_compacting_file]:
+            try:
                 os.remove(file)
                 logger.info(f"🗑️ Removido: {file}")
+            except FileNotFoundError:
+                pass
     
     # Carrega estado anterior
     cursor_manager.load_state()
@@ -842,7 +1283,8 @@ def main(args=None):
             logger.warning(f"Arquivo de AppIDs famosos não encontrado: {famous_appids_path}")
 
     logger.info("📦 Obtendo lista de jogos da Steam...")
-    all_games = get_all_game_list()
+    all_games = get_all_game_list(cursor_manager.game_list_cache_file,
+                                  refresh=getattr(args, 'refresh_game_list', False))
     if not all_games:
         logger.error("❌ Não foi possível obter a lista de jogos")
         return
@@ -850,37 +1292,32 @@ def main(args=None):
     for appid in famous_appids:
         all_games.append({'appid': appid, 'name': famous_games_dict.get(appid, f'FamousApp_{appid}')})
 
-    # Remove duplicatas mantendo o primeiro encontrado
-    unique_games = {}
+    # Índice appid -> jogo, sem duplicatas (mantém o primeiro encontrado): os filtros
+    # seguintes trabalham sobre as chaves inteiras, sem percorrer os dicts do catálogo
+    games_by_id = {}
     for g in all_games:
         appid = g.get('appid')
-        if appid not in unique_games:
-            unique_games[appid] = g
-    all_games = list(unique_games.values())
+        if appid and appid not in games_by_id:
+            games_by_id[appid] = g
 
     # Carrega App IDs existentes e atualiza cursor
     existing_details = get_existing_appids(args.game_details_file)
-    for appid in existing_details:
-        cursor_manager.processed_appids.add(appid)
+    cursor_manager.processed_appids.update(existing_details)
     
     # Atualiza contador de jogos encontrados
     cursor_manager.total_games_found = len(existing_details)
     
     # Filtra jogos restantes
-    remaining_games = cursor_manager.get_remaining_games(all_games)
+    remaining_games = cursor_manager.get_remaining_games(games_by_id)
 
-    # Garante que os jogos famosos estejam no início da lista, sem duplicados
-    seen_appids = set()
+    # Garante que os jogos famosos estejam no início da lista (já vem sem duplicados)
     famous_games = []
     other_games = []
     for g in remaining_games:
-        appid = g.get('appid')
-        if appid in famous_appids and appid not in seen_appids:
+        if g['appid'] in famous_appids:
             famous_games.append(g)
-            seen_appids.add(appid)
-        elif appid not in seen_appids:
+        else:
             other_games.append(g)
-            seen_appids.add(appid)
     remaining_games = famous_games + other_games
 
     if not remaining_games:
@@ -921,7 +1358,8 @@ def main(args=None):
 
     # Se não houver filtro, embaralha normalmente
     if not args.filter:
-        random.shuffle(filtered_games)
+        # Só os candidatos que devem ser consumidos precisam de ordem aleatória
+        partial_shuffle(filtered_games, games_needed * SHUFFLE_OVERSHOOT)
 
     remaining_games = filtered_games
     
@@ -929,8 +1367,21 @@ def main(args=None):
     progress_tracker = ProgressTracker(args.max_games)
     games_counter = ThreadSafeCounter(games_already_found, args.max_games)  # CONTADOR THREAD-SAFE
     
-    checkpoint_counter = 0
     processed_count = 0
+    executor = None  # Pool do modo paralelo (encerrado também no finally)
+    
+    # Flags, limites e argumentos lidos a cada jogo/future: resolvidos uma vez
+    stop_is_set = stop_processing.is_set
+    goal_is_set = goal_reached.is_set
+    reached_limit = games_counter.reached_limit
+    max_games = args.max_games
+    checkpoint_interval = args.checkpoint_interval
+    batch_size = args.batch_size
+    
+    # Catálogo, estado e controles montados acima vivem até o fim: tira esses objetos das
+    # varreduras do GC, que passam a olhar só os dicts/listas criados por jogo
+    gc.collect()
+    gc.freeze()
     
     try:
         if not args.parallel:
@@ -938,128 +1389,151 @@ def main(args=None):
             logger.info("🔄 Executando em modo SEQUENCIAL")
             
             for i, app in enumerate(remaining_games):
-                if stop_processing.is_set() or goal_reached.is_set():
+                if stop_is_set() or goal_is_set():
                     logger.info("🛑 Processamento interrompido")
                     break
                     
-                if games_counter.reached_limit():
-                    logger.info(f"🎯 Meta de {args.max_games} jogos atingida!")
+                if reached_limit():
+                    logger.info(f"🎯 Meta de {max_games} jogos atingida!")
                     break
                 
                 if processar_um_jogo(app, proxy_manager, args.game_details_file, 
                                    args.game_reviews_file, args, cursor_manager, games_counter,
                                    game_details_csv, game_reviews_csv):
-                    logger.info(f"📈 Progresso: {games_counter.value}/{args.max_games} jogos")
+                    logger.info(f"📈 Progresso: {games_counter.value}/{max_games} jogos")
                 
                 processed_count += 1
-                checkpoint_counter += 1
                 
-                # Checkpoint periódico
-                if checkpoint_counter >= args.checkpoint_interval:
-                    cursor_manager.save_state(force=True)
+                # Checkpoint periódico: um único gatilho para estado e progresso
+                if processed_count % checkpoint_interval == 0:
+                    cursor_manager.save_state()
                     progress_tracker.update(games_counter.value, processed_count)
-                    checkpoint_counter = 0
                     
         else:
             # ===== MODO PARALELO CORRIGIDO COM CONTROLE RIGOROSO =====
             logger.info(f"⚡ Executando em modo PARALELO com {args.workers} workers")
             
-            with ThreadPoolExecutor(max_workers=args.workers, thread_name_prefix="Worker") as executor:
-                
-                # Processa em batches menores para melhor controle
-                for batch_start in range(0, len(remaining_games), args.batch_size):
-                    if stop_processing.is_set() or goal_reached.is_set():
-                        logger.info("🛑 Meta atingida ou processamento interrompido - parando batches")
+            executor = ThreadPoolExecutor(max_workers=args.workers, thread_name_prefix="Worker")
+            # Tasks em voo: o bastante para nenhum worker ficar ocioso entre resultados
+            max_inflight = args.workers * INFLIGHT_PER_WORKER
+            
+            # Submissão em fluxo contínuo: no máximo max_inflight tasks em voo e cada task
+            # concluída abre espaço para a próxima, sem esvaziar a janela entre batches.
+            # O batch só delimita log, ajuste de tamanho pela vazão e recuo da API
+            games_iter = iter(remaining_games)
+            games_exhausted = False
+            pending = set()
+            interrupted = False
+            batch_num = 1
+            batch_rate = None  # Média móvel de tasks/s
+            batch_started = time.monotonic()
+            batch_errors_start = request_errors.value
+            completed_count = 0
+            logger.info(f"🔄 Batch {batch_num}: processando {batch_size} jogos "
+                      f"[{games_counter.value}/{max_games} encontrados]")
+            while not interrupted:
+                while not games_exhausted and len(pending) < max_inflight:
+                    # Verifica limite antes de submeter CADA task
+                    if stop_is_set() or reached_limit() or goal_is_set():
+                        logger.info(f"🎯 Meta atingida ou processamento interrompido - não submetendo mais tasks")
+                        games_exhausted = True
+                        break
+                    app = next(games_iter, None)
+                    if app is None:
+                        games_exhausted = True
                         break
                     
-                    batch_end = min(batch_start + args.batch_size, len(remaining_games))
-                    batch = remaining_games[batch_start:batch_end]
-                    
-                    batch_num = batch_start // args.batch_size + 1
-                    logger.info(f"🔄 Batch {batch_num}: processando {len(batch)} jogos "
-                              f"[{games_counter.value}/{args.max_games} encontrados]")
-                    
-                    # Submete tasks do batch
-                    futures = []
-                    for app in batch:
-                        # Verifica limite antes de submeter CADA task
-                        if games_counter.reached_limit() or goal_reached.is_set():
-                            logger.info(f"🎯 Meta atingida - não submetendo mais tasks")
-                            break
-                        
-                        future = executor.submit(
-                            processar_um_jogo,
-                            app,
-                            proxy_manager,
-                            args.game_details_file,
-                            args.game_reviews_file,
-                            args,
-                            cursor_manager,
-                            games_counter,
-                            game_details_csv,
-                            game_reviews_csv
-                        )
-                        futures.append(future)
-                    
-                    if not futures:  # Sem tasks submetidas
+                    pending.add(executor.submit(
+                        processar_um_jogo,
+                        app,
+                        proxy_manager,
+                        args.game_details_file,
+                        args.game_reviews_file,
+                        args,
+                        cursor_manager,
+                        games_counter,
+                        game_details_csv,
+                        game_reviews_csv
+                    ))
+                
+                if not pending:
+                    break
+                
+                # Um wait() por rodada para todas as tasks em voo, em vez de um timer por future
+                done, pending = wait(pending, timeout=45, return_when=FIRST_COMPLETED)
+                if not done:
+                    logger.warning(f"⏳ Nenhuma task concluída em 45s ({len(pending)} pendentes)")
+                    continue
+                
+                for future in done:
+                    if stop_is_set() or goal_is_set():
+                        # Descarta de uma vez as tasks ainda na fila do executor
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        logger.info("🛑 Meta atingida - cancelando tasks restantes")
+                        interrupted = True
                         break
                     
-                    # Processa resultados conforme completam
-                    completed_count = 0
-                    for future in as_completed(futures):
-                        if stop_processing.is_set() or goal_reached.is_set():
-                            # Cancela futures restantes
-                            for f in futures:
-                                if not f.done():
-                                    f.cancel()
-                            logger.info("🛑 Meta atingida - cancelando tasks restantes do batch")
-                            break
+                    try:
+                        result = future.result()
+                        completed_count += 1
                         
-                        try:
-                            result = future.result(timeout=45)  # Timeout aumentado
-                            completed_count += 1
+                        if result:  # Jogo válido processado
+                            current_count = games_counter.value
+                            logger.info(f"📈 [{current_count}/{max_games}] jogos encontrados")
                             
-                            if result:  # Jogo válido processado
-                                current_count = games_counter.value
-                                logger.info(f"📈 [{current_count}/{args.max_games}] jogos encontrados")
+                            # VERIFICA META IMEDIATAMENTE
+                            if reached_limit():
+                                logger.info(f"🎯 META DE {max_games} ATINGIDA! Cancelando tasks restantes...")
+                                goal_reached.set()
                                 
-                                # VERIFICA META IMEDIATAMENTE
-                                if games_counter.reached_limit():
-                                    logger.info(f"🎯 META DE {args.max_games} ATINGIDA! Cancelando tasks restantes...")
-                                    goal_reached.set()
-                                    
-                                    # Cancela todas as futures restantes
-                                    for f in futures:
-                                        if not f.done():
-                                            f.cancel()
-                                    break
-                        
-                        except Exception as exc:
-                            logger.error(f"❌ Erro em task: {exc}")
-                        
-                        processed_count += 1
-                        checkpoint_counter += 1
-                        
-                        # Checkpoint periódico
-                        if checkpoint_counter >= args.checkpoint_interval:
-                            cursor_manager.save_state()
-                            progress_tracker.update(games_counter.value, processed_count)
-                            checkpoint_counter = 0
+                                # Descarta de uma vez as tasks ainda na fila do executor
+                                executor.shutdown(wait=False, cancel_futures=True)
+                                interrupted = True
+                                break
                     
-                    logger.info(f"✅ Batch {batch_num} concluído: {completed_count}/{len(futures)} tasks processadas")
+                    except Exception as exc:
+                        logger.error(f"❌ Erro em task: {exc}")
                     
-                    # VERIFICA META APÓS CADA BATCH
-                    if games_counter.reached_limit() or goal_reached.is_set():
-                        logger.info("🎯 Meta atingida - finalizando processamento em batches")
-                        break
+                    processed_count += 1
                     
-                    # Pequena pausa entre batches para não sobrecarregar
-                    time.sleep(0.5)
-        
-        # Aguarda um momento para threads finalizarem completamente
-        if goal_reached.is_set():
-            logger.info("⏳ Aguardando finalização de threads...")
-            time.sleep(3)  # Pausa para threads terminarem graciosamente
+                    # Checkpoint periódico: um único gatilho para estado e progresso
+                    if processed_count % checkpoint_interval == 0:
+                        cursor_manager.save_state()
+                        progress_tracker.update(games_counter.value, processed_count)
+                
+                if interrupted or completed_count < batch_size:
+                    continue
+                
+                logger.info(f"✅ Batch {batch_num} concluído: {completed_count} tasks processadas")
+                
+                # Ajusta o próximo batch para durar ~BATCH_TARGET_SECONDS na vazão atual
+                elapsed = time.monotonic() - batch_started
+                rate = completed_count / elapsed if elapsed > 0 else 0.0
+                batch_rate = rate if batch_rate is None else (batch_rate + rate) / 2
+                batch_size = max(BATCH_SIZE_MIN, min(BATCH_SIZE_MAX, int(batch_rate * BATCH_TARGET_SECONDS)))
+                
+                # Pausa só quando a API respondeu com 429/erros (vazão baixa por poucos workers não conta);
+                # só as novas submissões esperam, as tasks em voo seguem
+                batch_errors = request_errors.value - batch_errors_start
+                error_ratio = batch_errors / max(1, completed_count)
+                if error_ratio >= THROTTLE_ERRORS_PER_TASK:
+                    backoff = min(5.0, BATCH_TARGET_SECONDS * error_ratio)
+                    logger.info(f"🐢 {batch_errors} erros de request no batch - aguardando {backoff:.1f}s")
+                    time.sleep(backoff)
+                
+                batch_num += 1
+                batch_started = time.monotonic()
+                batch_errors_start = request_errors.value
+                completed_count = 0
+                if not games_exhausted:
+                    logger.info(f"🔄 Batch {batch_num}: processando {batch_size} jogos "
+                              f"[{games_counter.value}/{max_games} encontrados]")
+            
+            if completed_count and not interrupted:
+                logger.info(f"✅ Batch {batch_num} concluído: {completed_count} tasks processadas")
+            
+            # Aguarda as tasks em execução (as que estavam na fila já foram descartadas na meta)
+            executor.shutdown(wait=True)
         
         # Salva estado final
         cursor_manager.save_state(force=True)
@@ -1075,12 +1549,16 @@ def main(args=None):
         logger.error(f"Stack trace: {traceback.format_exc()}")
         
     finally:
+        # Devolve os objetos congelados ao GC (main pode ser chamada de novo no mesmo processo)
+        gc.unfreeze()
+        
         # FORÇA PARADA DE TODAS AS THREADS
         stop_processing.set()
         goal_reached.set()
         
-        # Aguarda um pouco para threads finalizarem
-        time.sleep(1)
+        # Espera só o necessário: descarta a fila e junta as threads ainda ativas
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
         
         # Garantia de salvar estado final
         try: